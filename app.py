@@ -1,6 +1,9 @@
 # app.py
+import math
+from collections import namedtuple
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
 
 # ----------------------------
@@ -16,146 +19,270 @@ REQUIRED_COLS = [
     "Domain",
 ]
 
+LABELS = ("A", "B", "C", "D", "E")
+OPTION_COLS = [f"Option_{lab}" for lab in LABELS]
+# One displayed answer option (fixed fields, so a namedtuple rather than a dict)
+Option = namedtuple("Option", "disp_lab text label_text")
+
+# Per-question fields the quiz and review screens actually read
+ROW_COLS = ["Question", "Correct_Answer", "Explanation", "Domain"]
+
+REVIEW_PAGE_SIZE = 10
+
+# Text fields of each recorded answer (is_correct is stored separately as int8)
+RESULT_TEXT_COLS = [
+    "ts", "domain", "question",
+    "chosen_label", "chosen_text",
+    "correct_label", "correct_text",
+    "explanation",
+]
+
 DOMAIN_OPTIONS = ["All", "Ethics", "Assessment", "Intervention", "Communication"]
 
+# PCG64 generator (bounded draws use Lemire's method internally). Streamlit
+# re-executes this script on every rerun, so this is one freshly seeded
+# generator per script run, shared by all draws in that run.
+_RNG = np.random.default_rng()
+
 # ----------------------------
 # Data helpers
 # ----------------------------
-@st.cache_data
+def _read_csv(path: str) -> pd.DataFrame:
+    """
+    Arrow-backed, multithreaded read when pyarrow is available. Every column is
+    read as text with blank cells kept as "", so there is no type or NA
+    inference to undo afterwards. The pyarrow parser rejects short rows
+    (trailing blank fields left off), so those files fall back to the C
+    engine, which fills the missing cells with "".
+    """
+    opts = dict(encoding="utf-8-sig", keep_default_na=False)
+    try:
+        return pd.read_csv(path, engine="pyarrow", dtype="string[pyarrow]", **opts)
+    except (ImportError, pd.errors.ParserError):
+        return pd.read_csv(path, dtype=str, **opts)
+
+
+def norm_ws(s: pd.Series) -> pd.Series:
+    """Collapse whitespace runs and strip; split() is C-level, no regex engine."""
+    return pd.Series([" ".join(v.split()) for v in s], index=s.index, dtype=object)
+
+
+# cache_resource hands every rerun the same frame instead of unpickling a fresh
+# copy, so the frames returned here are shared: treat them as read-only.
+@st.cache_resource
 def load_questions(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path, encoding="utf-8-sig")
-    # Ensure required columns exist
-    for c in REQUIRED_COLS:
-        if c not in df.columns:
-            df[c] = ""
+    # Keep only the required columns, creating any that are missing
+    df = _read_csv(path).reindex(columns=REQUIRED_COLS, fill_value="")
     # Clean string columns
-    for c in df.columns:
-        if df[c].dtype == object:
-            df[c] = (
-                df[c]
-                .astype(str)
-                .str.replace(r"\s+", " ", regex=True)
-                .str.strip()
-                .replace({"nan": ""})
-            )
+    for c in REQUIRED_COLS:
+        df[c] = norm_ws(df[c])
+    # Low-cardinality labels: one small integer code per row instead of a str
+    df["Correct_Answer"] = df["Correct_Answer"].str.upper().astype("category")
+    df["Domain"] = df["Domain"].astype("category")
+    # Lowercased once here so domain filters don't redo it per call; as a
+    # category the filter compares small integer codes, not strings
+    df["Domain_lc"] = df["Domain"].str.lower().astype("category")
     return df
 
 
-def filter_by_domain(df: pd.DataFrame, domain_choice: str) -> pd.DataFrame:
+@st.cache_resource
+def domain_index(path: str) -> dict:
+    """
+    Row positions of each (lowercased) domain, plus "all". Built once per CSV
+    so choosing a domain is a dict lookup rather than a scan of the frame.
+    """
+    df = load_questions(path)
+    index = df.groupby("Domain_lc", observed=True).indices
+    index["all"] = np.arange(len(df))
+    return index
+
+
+def filter_by_domain(index: dict, domain_choice: str) -> np.ndarray:
     if domain_choice and domain_choice != "All":
-        return df[df["Domain"].str.lower() == domain_choice.lower()].copy()
-    return df.copy()
+        return index.get(domain_choice.lower(), np.empty(0, dtype=np.intp))
+    return index["all"]
 
 
-def prepare_items(df: pd.DataFrame, num: int):
+@st.cache_resource
+def question_items(path: str) -> list:
+    """
+    One prebuilt quiz item per CSV row, built once per CSV so starting a quiz
+    only has to sample. Items are built WITHOUT shuffling: options keep their
+    original A–E order and the correct answer letter stays exactly as in the
+    CSV. Shared across sessions: treat the items as read-only.
     """
-    Build items WITHOUT shuffling. Options are displayed in original A–E order,
-    and the correct answer letter remains exactly as in the CSV.
+    df = load_questions(path)
+    rows = df[ROW_COLS].itertuples(index=False, name="QuizRow")
+    # (N, 5) option matrix; cells were already cleaned in load_questions
+    opts = df[OPTION_COLS].to_numpy()
+    # Correct letter is the original CSV value (uppercased at load)
+    correct = df["Correct_Answer"].to_numpy()
+    return [_make_item(r, row_opts, ca) for r, row_opts, ca in zip(rows, opts, correct)]
+
+
+def prepare_items(all_items: list, pool: np.ndarray, num: int):
     """
-    if df.empty:
+    Draw up to `num` distinct row positions from `pool` (see filter_by_domain)
+    and return the matching prebuilt items from question_items.
+    """
+    if len(pool) == 0:
         return []
-    if num > len(df):
-        num = len(df)
-
-    # sample rows (without reordering options)
-    rows = df.sample(n=num, random_state=None).to_dict(orient="records")
-
-    items = []
-    for r in rows:
-        # Keep original A..E order; drop blanks
-        orig = [(lab, r.get(f"Option_{lab}", "").strip()) for lab in list("ABCDE")]
-        orig = [(lab, txt) for lab, txt in orig if txt]
-
-        # For display we keep the original label as the visible label
-        disp = [{"disp_lab": lab, "orig_lab": lab, "text": txt} for lab, txt in orig]
-
-        # Correct letter is the original CSV value
-        correct_letter = (r.get("Correct_Answer", "") or "").strip().upper()
-
-        items.append(
-            {
-                "row": r,
-                "disp": disp,
-                "correct_disp": correct_letter,  # same as original
-            }
-        )
-    return items
+    if num > len(pool):
+        num = len(pool)
+
+    picks = _RNG.choice(pool, size=num, replace=False)
+    return [all_items[i] for i in picks]
+
+
+def _make_item(row, row_opts, correct_letter: str) -> dict:
+    # Keep original A..E order and drop blanks; the original label is the visible label
+    disp = [
+        Option(disp_lab=lab, text=txt, label_text=f"{lab}. {txt}")
+        for lab, txt in zip(LABELS, row_opts)
+        if txt
+    ]
+    return {
+        "row": row,
+        # Built once here rather than on every rerun of the quiz screen
+        "choices": [d.label_text for d in disp],
+        "choice_index": {d.label_text: d for d in disp},
+        "by_lab": {d.disp_lab: d for d in disp},  # O(1) lookups on submit
+        "correct_disp": correct_letter,  # same as original
+    }
 
 
 def reset_quiz_state():
     st.session_state["q_items"] = []
     st.session_state["index"] = 0
     st.session_state["score"] = 0
-    st.session_state["results"] = []
+    st.session_state["results"] = new_results(0)
+    st.session_state["domain_counts"] = {}
+    # Unsent flags outlive a restart
+    st.session_state.setdefault("pending_flags", {})
 
 
-def start_quiz(df: pd.DataFrame, domain_choice: str, num_questions: int):
+def start_quiz(all_items: list, pool: np.ndarray, num_questions: int):
+    items = prepare_items(all_items, pool, num_questions)
     st.session_state["score"] = 0
     st.session_state["index"] = 0
-    st.session_state["results"] = []
-    df_filt = filter_by_domain(df, domain_choice)
-    st.session_state["q_items"] = prepare_items(df_filt, num_questions)
+    st.session_state["results"] = new_results(len(items))
+    st.session_state["domain_counts"] = {}  # domain -> [answered, correct]
+    st.session_state["q_items"] = items
+
+
+def new_results(n: int) -> dict:
+    """
+    Columnar answer log: one preallocated array per field, written by question
+    index on submit and read back by position on the results page.
+    """
+    cols = {c: np.empty(n, dtype=object) for c in RESULT_TEXT_COLS}
+    cols["is_correct"] = np.zeros(n, dtype=np.int8)
+    return cols
+
+
+def record_answer(idx: int, **fields):
+    results = st.session_state["results"]
+    for k, v in fields.items():
+        results[k][idx] = v
 
 
 # ----------------------------
 # Google Sheets (optional)
 # ----------------------------
-def submit_flag_to_sheets(question_text: str, reason: str):
+def _get_flag_ws():
+    """
+    The flags worksheet for the current secrets, or None when they aren't
+    configured. Secrets are read on every call (outside the cache), so adding
+    them later takes effect without a server restart.
+    """
+    sheet_id = st.secrets.get("GSPREAD_SHEET_ID", None)
+    svc = st.secrets.get("gcp_service_account", None)
+    if not sheet_id or not svc:
+        return None
+    return _open_flag_ws(sheet_id, tuple(sorted(dict(svc).items())))
+
+
+@st.cache_resource
+def _open_flag_ws(sheet_id: str, svc_items: tuple):
     """
-    Append a flag row to Google Sheets if secrets are configured.
-    Tries to find a worksheet named 'Flags' or 'flags' (case-insensitive).
-    Creates 'Flags' if none exist.
+    Open the flags worksheet once per (sheet, service account) instead of
+    re-authorizing and re-opening the spreadsheet on every flag. Connection
+    errors propagate (and aren't cached) so the next flag retries. Tries to
+    find a worksheet named 'Flags' or 'flags' (case-insensitive). Creates
+    'Flags' if none exist.
     """
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+    creds = Credentials.from_service_account_info(dict(svc_items), scopes=scopes)
+    client = gspread.authorize(creds)
+    sh = client.open_by_key(sheet_id)
+
+    # Try to find any sheet named case-insensitively like "flags"
+    for w in sh.worksheets():
+        if w.title.lower() == "flags":
+            return w
+
+    # Create once if not present
     try:
-        sheet_id = st.secrets.get("GSPREAD_SHEET_ID", None)
-        svc = st.secrets.get("gcp_service_account", None)
-        if not sheet_id or not svc:
-            st.warning("Flag received locally, but Google Sheets is not configured in secrets.")
-            return False
+        ws = sh.add_worksheet(title="Flags", rows=200, cols=5)
+        ws.append_row(["timestamp", "question", "reason"])
+    except Exception:
+        # If it exists but with odd casing and add_worksheet failed, search again strictly
+        ws = sh.worksheet("Flags")
+    return ws
 
-        import gspread
-        from google.oauth2.service_account import Credentials
 
-        scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        creds = Credentials.from_service_account_info(svc, scopes=scopes)
-        client = gspread.authorize(creds)
-        sh = client.open_by_key(sheet_id)
+def queue_flag(question_text: str, reason: str):
+    """
+    Hold a flag in the session until the user sends the batch. Keyed by
+    (question, reason), so re-submitting the same flag doesn't duplicate it.
+    """
+    st.session_state["pending_flags"].setdefault(
+        (question_text, reason),
+        [datetime.now().isoformat(timespec="seconds"), question_text, reason],
+    )
 
-        # Try to find any sheet named case-insensitively like "flags"
-        ws = None
-        for w in sh.worksheets():
-            if w.title.lower() == "flags":
-                ws = w
-                break
 
+def submit_flags_to_sheets(rows: list) -> bool:
+    """
+    Append queued flag rows to Google Sheets in a single append_rows call
+    (one API round trip for the whole batch) if secrets are configured.
+    """
+    try:
+        ws = _get_flag_ws()
         if ws is None:
-            # Create once if not present
-            try:
-                ws = sh.add_worksheet(title="Flags", rows=200, cols=5)
-                ws.append_row(["timestamp", "question", "reason"])
-            except Exception:
-                # If it exists but with odd casing and add_worksheet failed, search again strictly
-                ws = sh.worksheet("Flags")
-
-        ws.append_row(
-            [datetime.now().isoformat(timespec="seconds"), question_text, reason],
-            value_input_option="USER_ENTERED",
-        )
+            st.warning("Flags received locally, but Google Sheets is not configured in secrets.")
+            return False
+
+        ws.append_rows(rows, value_input_option="USER_ENTERED")
         return True
     except Exception as e:
-        st.error(f"Unable to log flag to Google Sheets: {e}")
+        st.error(f"Unable to log flags to Google Sheets: {e}")
         return False
 
 
+def flush_flags() -> bool:
+    """Send every queued flag in one batch; the queue is cleared only on success."""
+    pending = st.session_state["pending_flags"]
+    if not pending:
+        return True
+    if submit_flags_to_sheets(list(pending.values())):
+        pending.clear()
+        return True
+    return False
+
+
 # ----------------------------
 # UI pieces
 # ----------------------------
-def title_page(df_all: pd.DataFrame):
-    total_count = len(df_all)
+def title_page(index: dict):
+    # Counts come straight from the cached domain index; no DataFrame pass
+    total_count = len(index["all"])
     by_domain = (
-        df_all.assign(Domain=df_all["Domain"].fillna("").replace("nan", ""))
-        .groupby(df_all["Domain"].str.title().fillna("Unknown"))
-        .size()
+        pd.Series({d.title(): len(rows) for d, rows in index.items() if d != "all"}, dtype=int)
+        .rename_axis("Domain")
         .sort_values(ascending=False)
     )
 
@@ -178,7 +305,7 @@ This app started as **my personal study tool** for the National Psychology Exam
 **How it works**
 - Pick a **Domain** and **Number of questions** in the sidebar, then hit **Start quiz**.
 - Questions appear with options in their **original A–E order** (no shuffling).
-- At the end you’ll get a **scrollable list of every question**, your answer, the **correct answer**, and an explanation.
+- At the end you’ll get a **paged review of every question**, your answer, the **correct answer**, and an explanation.
 - You’ll also see a **bar chart** breaking down accuracy by domain so you can target your next study session.
 
 **Help me improve it**
@@ -190,20 +317,20 @@ When you’re ready, use the **sidebar** to start your quiz.
     )
 
 
+@st.fragment
 def quiz_screen(item, idx, total):
+    """Radio clicks rerun only this fragment; Submit triggers a full-app rerun."""
     r = item["row"]
-    disp = item["disp"]
     correct_disp = item["correct_disp"]  # original correct letter
 
     st.subheader(f"Question {idx+1} of {total}")
-    st.write(r.get("Question", ""))
-    st.caption(f"Domain: {r.get('Domain','—')}")
+    st.write(r.Question)
+    st.caption(f"Domain: {r.Domain}")
 
     # Keep original letters for display (no default selection)
-    display_choices = [f"{d['disp_lab']}. {d['text']}" for d in disp]
     choice = st.radio(
         label="Choose one:",
-        options=display_choices,
+        options=item["choices"],
         index=None,
         key=f"choice_{idx}",
         label_visibility="collapsed",
@@ -216,7 +343,8 @@ def quiz_screen(item, idx, total):
             st.warning("Please select an answer before submitting.")
             return
 
-        chosen_lab = choice.split(".", 1)[0].strip()
+        chosen = item["choice_index"][choice]
+        chosen_lab = chosen.disp_lab
         is_correct = (chosen_lab == (correct_disp or ""))
 
         if is_correct:
@@ -225,38 +353,102 @@ def quiz_screen(item, idx, total):
         else:
             st.error(f"Incorrect. Correct is {correct_disp}.")
 
-        expl = r.get("Explanation", "")
+        expl = r.Explanation
         if expl:
             st.info(f"**Explanation:** {expl}")
 
         # Pull the chosen/correct texts
-        def text_for(label):
-            for d in disp:
-                if d["disp_lab"] == label:
-                    return d["text"]
-            return ""
-
-        correct_text = text_for(correct_disp)
-        chosen_text = text_for(chosen_lab)
-
-        st.session_state["results"].append(
-            {
-                "ts": datetime.now().isoformat(timespec="seconds"),
-                "domain": r.get("Domain", ""),
-                "question": r.get("Question", ""),
-                "chosen_label": chosen_lab,
-                "chosen_text": chosen_text,
-                "correct_label": correct_disp or r.get("Correct_Answer", ""),
-                "correct_text": correct_text,
-                "explanation": expl,
-                "is_correct": int(is_correct),
-            }
+        correct_opt = item["by_lab"].get(correct_disp)
+        correct_text = correct_opt.text if correct_opt else ""
+        chosen_text = chosen.text
+
+        record_answer(
+            idx,
+            ts=datetime.now().isoformat(timespec="seconds"),
+            domain=r.Domain,
+            question=r.Question,
+            chosen_label=chosen_lab,
+            chosen_text=chosen_text,
+            correct_label=correct_disp or r.Correct_Answer,
+            correct_text=correct_text,
+            explanation=expl,
+            is_correct=int(is_correct),
         )
+        tally = st.session_state["domain_counts"].setdefault(r.Domain, [0, 0])
+        tally[0] += 1
+        tally[1] += int(is_correct)
 
         st.session_state["index"] += 1
         st.rerun()
 
 
+@st.fragment
+def flag_form():
+    """Reruns on its own when a flag is submitted; the review list above is left alone."""
+    st.markdown("### Flag an inaccurate question")
+    with st.form("flag_form"):
+        questions_list = list(st.session_state["results"]["question"])
+        q_pick = st.selectbox(
+            "Which question needs review?",
+            options=questions_list if questions_list else ["—"],
+            index=0,
+        )
+        reason = st.text_area("What’s wrong? Be as specific as possible.")
+        submitted = st.form_submit_button("Submit flag")
+        if submitted:
+            if questions_list and q_pick != "—" and reason.strip():
+                queue_flag(q_pick, reason.strip())
+                st.success("Thanks — flag added. Use **Send flags** below when you’re done.")
+            else:
+                st.warning("Please select a question and enter a reason.")
+
+    pending = st.session_state["pending_flags"]
+    if pending:
+        # Reserve the queue's spot above the button, but fill it only after the
+        # click is handled so a successful send doesn't show the old queue
+        queue_box = st.container()
+        if st.button("Send flags", key="send_flags"):
+            n = len(pending)
+            if flush_flags():
+                st.success(f"Thanks — {n} flag(s) submitted.")
+            else:
+                st.info("Flags saved locally. (If Google Sheets isn’t configured, add secrets later and try again.)")
+        if pending:
+            with queue_box:
+                st.caption(f"{len(pending)} flag(s) waiting to be sent.")
+                st.table([{"Question": q, "Reason": why} for q, why in pending])
+
+
+@st.fragment
+def review_list(results: dict):
+    """One page of the answer review; paging reruns only this fragment."""
+    n = len(results["is_correct"])
+    n_pages = math.ceil(n / REVIEW_PAGE_SIZE)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+    start = (page - 1) * REVIEW_PAGE_SIZE
+
+    # Read the page straight from the column arrays; no DataFrame/iterrows
+    for i in range(start, min(start + REVIEW_PAGE_SIZE, n)):
+        row = {c: col[i] for c, col in results.items()}
+        st.markdown("---")
+        st.markdown(f"**Q{i+1}. {row['question']}**")
+        st.caption(f"Domain: {row['domain'] or '—'}")
+
+        chosen = f"{row['chosen_label']}. {row['chosen_text']}".strip() if row['chosen_label'] else "—"
+        correct = f"{row['correct_label']}. {row['correct_text']}".strip()
+
+        if row["is_correct"]:
+            st.markdown(f"**✅ Your answer:** {chosen}")
+        else:
+            st.markdown(f"**❌ Your answer:** {chosen}")
+            st.markdown(f"**✅ Correct answer:** {correct}")
+
+        if str(row.get("explanation", "")).strip():
+            st.markdown(f"**Explanation:** {row['explanation']}")
+
+
 def results_screen():
     st.success("Quiz complete!")
     total = len(st.session_state.get("q_items", []))
@@ -264,38 +456,24 @@ def results_screen():
 
     st.metric("Score", f"{score}/{total}", f"{(score/total*100 if total else 0):.1f}%")
 
-    res_df = pd.DataFrame(st.session_state.get("results", []))
+    results = st.session_state["results"]
 
     st.markdown("### Review your answers")
-    if res_df.empty:
+    if not len(results["is_correct"]):
         st.info("No answers recorded.")
     else:
-        for i, row in res_df.iterrows():
-            st.markdown("---")
-            st.markdown(f"**Q{i+1}. {row['question']}**")
-            st.caption(f"Domain: {row['domain'] or '—'}")
-
-            chosen = f"{row['chosen_label']}. {row['chosen_text']}".strip() if row['chosen_label'] else "—"
-            correct = f"{row['correct_label']}. {row['correct_text']}".strip()
-
-            if row["is_correct"]:
-                st.markdown(f"**✅ Your answer:** {chosen}")
-            else:
-                st.markdown(f"**❌ Your answer:** {chosen}")
-                st.markdown(f"**✅ Correct answer:** {correct}")
-
-            if str(row.get("explanation", "")).strip():
-                st.markdown(f"**Explanation:** {row['explanation']}")
+        review_list(results)
 
         st.markdown("")
 
         # Domain performance bar chart at the end
         st.markdown("### Performance by domain")
+        # Running per-domain tallies kept by the submit handler; no groupby here
+        counts = st.session_state["domain_counts"]
         acc = (
-            res_df.groupby("domain")["is_correct"]
-            .mean()
-            .fillna(0.0)
-            .mul(100)
+            pd.Series({d: correct / answered * 100 for d, (answered, correct) in counts.items()}, dtype=float)
+            .rename_axis("domain")
+            .sort_index()
             .round(1)
         )
         if not acc.empty:
@@ -307,29 +485,18 @@ def results_screen():
             )
 
     # Flagging form at the very end
-    st.markdown("### Flag an inaccurate question")
-    with st.form("flag_form"):
-        questions_list = [r["question"] for r in st.session_state.get("results", [])]
-        q_pick = st.selectbox(
-            "Which question needs review?",
-            options=questions_list if questions_list else ["—"],
-            index=0,
-        )
-        reason = st.text_area("What’s wrong? Be as specific as possible.")
-        submitted = st.form_submit_button("Submit flag")
-        if submitted:
-            if questions_list and q_pick != "—" and reason.strip():
-                ok = submit_flag_to_sheets(q_pick, reason.strip())
-                if ok:
-                    st.success("Thanks — your flag was submitted.")
-                else:
-                    st.info("Flag saved locally. (If Google Sheets isn’t configured, add secrets later and try again.)")
-            else:
-                st.warning("Please select a question and enter a reason.")
+    flag_form()
 
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Restart"):
+            # Don't leave flags behind just because they weren't sent yet. The
+            # rerun below would swallow any error, so leave a notice for it
+            if not flush_flags():
+                st.session_state["flag_notice"] = (
+                    f"{len(st.session_state['pending_flags'])} flag(s) couldn’t be sent and are still "
+                    "queued; you can send them from the results screen of your next quiz."
+                )
             reset_quiz_state()
             st.rerun()
     with col2:
@@ -342,8 +509,9 @@ def results_screen():
 def main():
     st.set_page_config(page_title="NPE Quiz", page_icon="🧠", layout="centered")
 
-    # Load questions
-    df_all = load_questions(BUNDLED_CSV)
+    # Row positions per domain; the question frame itself is only touched
+    # (through the cached builders) when a quiz starts
+    index = domain_index(BUNDLED_CSV)
 
     # Sidebar controls
     with st.sidebar:
@@ -351,7 +519,8 @@ def main():
 
         domain_choice = st.selectbox("Domain", DOMAIN_OPTIONS, index=0)
 
-        avail = len(filter_by_domain(df_all, domain_choice))
+        pool = filter_by_domain(index, domain_choice)
+        avail = len(pool)
         if avail == 0:
             st.caption("No questions available for this domain.")
         max_q = max(avail, 1)
@@ -365,15 +534,20 @@ def main():
         )
 
         if st.button("Start quiz"):
-            start_quiz(df_all, domain_choice, int(num_questions))
+            start_quiz(question_items(BUNDLED_CSV), pool, int(num_questions))
             st.rerun()
 
+    # Shown once, after a Restart whose flag send failed
+    notice = st.session_state.pop("flag_notice", None)
+    if notice:
+        st.warning(notice)
+
     # Body – title page, quiz, or results
     items = st.session_state.get("q_items", [])
     idx = st.session_state.get("index", 0)
 
     if not items:
-        title_page(df_all)
+        title_page(index)
         return
 
     if idx >= len(items):
@@ -1,7 +1,8 @@
-import sys, pandas as pd
+import sys, numpy as np, pandas as pd
 
 path = sys.argv[1] if len(sys.argv) > 1 else "data/questions.csv"
-df = pd.read_csv(path, encoding="utf-8-sig")
+# keep_default_na=False keeps blank cells as "" (not NaN -> "nan"), matching the app
+df = pd.read_csv(path, encoding="utf-8-sig", dtype=str, keep_default_na=False)
 
 required = ["Question","Option_A","Option_B","Option_C","Option_D","Option_E","Correct_Answer","Explanation","Domain","Source"]
 for c in required:
@@ -9,27 +10,29 @@ for c in required:
         print(f"[ERROR] Missing column: {c}")
         sys.exit(1)
 
-errors = 0
-seen = set()
-for i, r in df.iterrows():
-    q = str(r.get("Question","")).strip()
-    ca = str(r.get("Correct_Answer","")).strip().upper()
-    if not q:
-        print(f"[ERROR] Row {i}: empty Question")
-        errors += 1
-        continue
-    if q.lower() in seen:
-        print(f"[WARN] Row {i}: duplicate Question")
-    else:
-        seen.add(q.lower())
-    if ca not in list("ABCDE"):
-        print(f"[ERROR] Row {i}: Correct_Answer not A–E: {ca}")
-        errors += 1
-    else:
-        opt = str(r.get(f"Option_{ca}","")).strip()
-        if not opt:
-            print(f"[ERROR] Row {i}: Correct_Answer points to empty Option_{ca}")
-            errors += 1
+labels = list("ABCDE")
+q = df["Question"].str.strip()
+ca = df["Correct_Answer"].str.strip().str.upper()
 
+# Whole-column masks instead of a per-row loop
+has_q = q.ne("")
+valid_ca = has_q & ca.isin(labels)
+dup = has_q & q.str.lower().where(has_q).duplicated()
+
+# Text of the option each row's Correct_Answer points to
+opts = df[[f"Option_{l}" for l in labels]].to_numpy()
+col = ca.map({l: k for k, l in enumerate(labels)}).fillna(0).astype(int).to_numpy()
+correct_opt = pd.Series(opts[np.arange(len(df)), col], index=df.index).str.strip()
+empty_opt = valid_ca & correct_opt.eq("")
+
+issues = []
+issues += [(i, f"[ERROR] Row {i}: empty Question") for i in df.index[~has_q]]
+issues += [(i, f"[WARN] Row {i}: duplicate Question") for i in df.index[dup]]
+issues += [(i, f"[ERROR] Row {i}: Correct_Answer not A–E: {ca[i]}") for i in df.index[has_q & ~valid_ca]]
+issues += [(i, f"[ERROR] Row {i}: Correct_Answer points to empty Option_{ca[i]}") for i in df.index[empty_opt]]
+for _, msg in sorted(issues, key=lambda t: t[0]):
+    print(msg)
+
+errors = int((~has_q).sum() + (has_q & ~valid_ca).sum() + empty_opt.sum())
 print("Done with", "errors." if errors else "no blocking errors.")
 sys.exit(1 if errors else 0)